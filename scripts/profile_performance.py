@@ -13,10 +13,11 @@ import time
 from pathlib import Path
 import sys
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+# Add the project root to path and import the module under the same name as
+# the tests, so Numba's on-disk kernel cache resolves in both
+sys.path.append(str(Path(__file__).parent.parent))
 
-from data_processor import DataProcessor
+from src.data_processor import DataProcessor, NUMBA_AVAILABLE, NUMEXPR_AVAILABLE, PYARROW_AVAILABLE
 
 def create_performance_dataset(rows=50000, null_frequency=0.1):
     """
@@ -29,29 +30,47 @@ def create_performance_dataset(rows=50000, null_frequency=0.1):
     Returns:
         pd.DataFrame: Generated dataset
     """
-    np.random.seed(42)  # For reproducible results
+    rng = np.random.default_rng(42)  # For reproducible results
     
     data = {
-        'user_id': range(rows),
-        'age': np.random.randint(18, 80, rows),
-        'income': np.random.normal(50000, 20000, rows),
-        'score': np.random.exponential(2.0, rows),
-        'department': np.random.choice(['Engineering', 'Marketing', 'Sales', 'HR'], rows),
-        'is_active': np.random.choice([True, False], rows, p=[0.7, 0.3])
+        'user_id': np.arange(rows, dtype=np.int32),
+        'age': rng.integers(18, 80, rows, dtype=np.int8),
+        'income': rng.normal(50000, 20000, rows).astype(np.float32),
+        'score': rng.exponential(2.0, rows).astype(np.float32),
+        'department': pd.Categorical.from_codes(
+            rng.integers(0, 4, rows, dtype=np.int8), ['Engineering', 'Marketing', 'Sales', 'HR']
+        ),
+        'is_active': rng.random(rows) < 0.7
     }
     
-    df = pd.DataFrame(data)
+    # Introduce null values realistically, before wrapping the arrays
+    null_mask = rng.random(rows) < null_frequency
+    data['income'][null_mask] = np.nan
+    data['score'][null_mask] = np.nan
     
-    # Introduce null values realistically
-    null_mask = np.random.random(rows) < null_frequency
-    df.loc[null_mask, 'income'] = np.nan
-    df.loc[null_mask, 'score'] = np.nan
+    df = pd.DataFrame(data, copy=False)
     
     print(f"Created performance dataset: {df.shape[0]} rows, {df.shape[1]} columns")
     print(f"Null values: {df.isnull().sum().sum()} total")
     
     return df
 
+def snapshot_columns(df):
+    """
+    Capture the column arrays of a DataFrame for cheap reconstruction.
+    
+    Args:
+        df (pd.DataFrame): Dataset to snapshot
+    
+    Returns:
+        dict: Column name to backing array
+    """
+    return {col: df[col].array for col in df.columns}
+
+def restore_dataset(snapshot):
+    """Rebuild a DataFrame from a column snapshot without copying the arrays."""
+    return pd.DataFrame(snapshot, copy=False)
+
 def profile_clean_data_operation():
     """Profile the clean_data method with detailed analysis."""
     print("=" * 60)
@@ -59,19 +78,27 @@ def profile_clean_data_operation():
     print("=" * 60)
     
     processor = DataProcessor()
-    processor.data = create_performance_dataset(10000)
+    pristine = snapshot_columns(create_performance_dataset(10000))
+    
+    # Warm up outside the profiled region so JIT compilation is not measured
+    processor.data = restore_dataset(pristine)
+    processor.clean_data()
     
     # Setup profiler
     profiler = cProfile.Profile()
-    profiler.enable()
+    timings = []
     
-    # Execute operation multiple times for meaningful profiling
+    # Execute operation multiple times for meaningful profiling; the dataset is
+    # restored (and its schema refreshed) outside the profiled and timed region
     for _ in range(100):
+        processor.data = restore_dataset(pristine)
+        start = time.perf_counter()
+        profiler.enable()
         processor.clean_data()
-        # Reset data for next iteration
-        processor.data = create_performance_dataset(10000)
+        profiler.disable()
+        timings.append(time.perf_counter() - start)
     
-    profiler.disable()
+    print(f"clean_data: best {min(timings):.6f}s, mean {sum(timings) / len(timings):.6f}s over {len(timings)} runs")
     
     # Analyze and print results
     print("\nTop 10 functions by cumulative time:")
@@ -112,22 +139,26 @@ def benchmark_operations():
         print(f"\n{dataset_name} Dataset:")
         print("-" * 30)
         
-        processor.data = dataset.copy()
+        # Reset from the column arrays instead of deep-copying the DataFrame
+        snapshot = snapshot_columns(dataset)
         dataset_results = {}
         
         for op_name, op_code in operations:
-            # Time the operation
-            timer = timeit.Timer(op_code, globals={'processor': processor})
+            # Restore the dirty dataset in setup, which repeat() runs before
+            # every single-call measurement, so clean_data/filter_by_value
+            # never time a run on already-reduced data
+            timer = timeit.Timer(
+                op_code,
+                setup='processor.data = restore_dataset(snapshot)',
+                globals={'processor': processor, 'snapshot': snapshot, 'restore_dataset': restore_dataset}
+            )
             
             # Run multiple times and take average
-            number, time_taken = timer.autorange()
-            avg_time = time_taken / number
+            timings = timer.repeat(repeat=20, number=1)
+            avg_time = sum(timings) / len(timings)
             
             dataset_results[op_name] = avg_time
             print(f"  {op_name:20}: {avg_time:.6f} seconds")
-            
-            # Reset data after each operation
-            processor.data = dataset.copy()
         
         benchmark_results[dataset_name] = dataset_results
     
@@ -172,28 +203,35 @@ def scalability_analysis():
     print("SCALABILITY ANALYSIS")
     print("=" * 60)
     
-    dataset_sizes = [1000, 5000, 10000, 25000, 50000]
+    dataset_sizes = [1000, 5000, 10000, 25000, 50000, 100000]
+    clean_runs = 10
+    mean_runs = 100
     clean_times = []
     mean_times = []
     
     for size in dataset_sizes:
         processor = DataProcessor()
-        processor.data = create_performance_dataset(size)
+        snapshot = snapshot_columns(create_performance_dataset(size))
+        
+        # Warm up outside the timed region so JIT compilation is not measured
+        processor.data = restore_dataset(snapshot)
+        processor.clean_data()
         
-        # Time clean_data
-        clean_time = timeit.timeit(
-            'processor.clean_data()', 
-            globals=locals(), 
-            number=10
-        ) / 10
+        # Time clean_data, restoring the nulls before each (untimed) run
+        elapsed_ns = 0
+        for _ in range(clean_runs):
+            processor.data = restore_dataset(snapshot)
+            start = time.perf_counter_ns()
+            processor.clean_data()
+            elapsed_ns += time.perf_counter_ns() - start
+        clean_time = elapsed_ns / clean_runs / 1e9
         
-        # Time calculate_mean
-        processor.data = create_performance_dataset(size)
-        mean_time = timeit.timeit(
-            'processor.calculate_mean("income")', 
-            globals=locals(), 
-            number=100
-        ) / 100
+        # Time calculate_mean, which leaves the data unchanged
+        processor.data = restore_dataset(snapshot)
+        start = time.perf_counter_ns()
+        for _ in range(mean_runs):
+            processor.calculate_mean("income")
+        mean_time = (time.perf_counter_ns() - start) / mean_runs / 1e9
         
         clean_times.append(clean_time)
         mean_times.append(mean_time)
@@ -206,7 +244,7 @@ def scalability_analysis():
         mean_scaling = mean_times[-1] / mean_times[0]
         size_scaling = dataset_sizes[-1] / dataset_sizes[0]
         
-        print(f"\nScaling Analysis:")
+        print("\nScaling Analysis:")
         print(f"  Dataset size increased by: {size_scaling:.1f}x")
         print(f"  clean_data time increased by: {clean_scaling:.1f}x")
         print(f"  calculate_mean time increased by: {mean_scaling:.1f}x")
@@ -239,16 +277,20 @@ def generate_performance_report():
     large_mean_time = benchmark_results['Large (50K)']['calculate_mean']
     scaling_factor = large_mean_time / small_mean_time
     
-    print(f"Performance Insights:")
+    print("Performance Insights:")
     print(f"  • Mean calculation on 50K dataset: {large_mean_time:.6f}s")
     print(f"  • Scaling factor (1K to 50K): {scaling_factor:.1f}x")
     print(f"  • Peak memory usage: {max(mem for _, mem in memory_usage):.1f} MB")
     
-    # Optimization recommendations
-    print(f"\nOptimization Recommendations:")
-    print(f"  • Consider caching for frequently accessed columns")
-    print(f"  • Implement chunk processing for very large datasets")
-    print(f"  • Use more efficient data types where possible")
+    # Optimization recommendations: options this run did not exercise
+    print("\nOptimization Recommendations:")
+    missing = [name for name, available in [('Numba', NUMBA_AVAILABLE),
+                                            ('numexpr', NUMEXPR_AVAILABLE),
+                                            ('PyArrow', PYARROW_AVAILABLE)] if not available]
+    if missing:
+        print(f"  • Install {', '.join(missing)} (pip install -e .[fast]) for the accelerated paths")
+    print("  • Load with downcast=True and categorize=True to shrink numeric and repetitive text columns")
+    print("  • Use streaming_mean/streaming_clean for CSV files larger than memory")
     
     return {
         'profile': profile_stats,
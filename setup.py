@@ -12,6 +12,14 @@ setup(
     ],
     python_requires=">=3.9",
     extras_require={
+        "fast": [
+            "numba>=0.57.0",
+            "numexpr>=2.8.0",
+            "pyarrow>=10.0.0",
+        ],
+        "polars": [
+            "polars>=0.20.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
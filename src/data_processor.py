@@ -2,27 +2,785 @@
 DataProcessor - A robust data processing and analysis class.
 Handles data loading, cleaning, filtering, and statistical operations.
 """
-import pandas as pd
+import os
+import warnings
+
+# FireDucks is a drop-in, compiler-accelerated pandas; opt in explicitly
+# because its lazy execution can defer errors past the failing call
+if os.environ.get('DATA_PROCESSOR_FIREDUCKS') == '1':
+    try:
+        import fireducks.pandas as pd
+    except ImportError:
+        import pandas as pd
+else:
+    import pandas as pd
 import numpy as np
 from typing import Union, Optional
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # numexpr is an optional accelerator
+    NUMEXPR_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:  # PyArrow is an optional accelerator
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    from polars.datatypes import is_polars_dtype
+    POLARS_AVAILABLE = True
+except ImportError:  # Polars is an optional backend
+    POLARS_AVAILABLE = False
+
+try:
+    import cudf
+    CUDF_AVAILABLE = True
+except ImportError:  # cuDF is an optional GPU backend
+    CUDF_AVAILABLE = False
+
+PANDAS_MAJOR_VERSION = int(pd.__version__.split('.')[0])
+
+# Minimum column length before filter_by_value hands comparisons to numexpr
+NUMEXPR_MIN_ROWS = 10_000
+
+# Bytes per block when PyArrow parses a memory-mapped CSV
+CSV_BLOCK_SIZE = 1 << 20
+
+# Bytes of CSV text the cuDF backend parses per read_csv call
+CUDF_CSV_CHUNK_BYTES = 256 << 20
+
+# With categorize=True, loaded text columns with fewer distinct values than
+# this share of rows are stored as categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.05
+
+
+def _column_stats_numpy(arr2d):
+    """
+    Return per-column (count, mean, max, min, M2) of a 2D float array,
+    skipping NaN.
+    
+    M2 is the sum of squared deviations from the mean, so the sample
+    variance is M2 / (count - 1).
+    """
+    counts = np.count_nonzero(~np.isnan(arr2d), axis=0)
+    with warnings.catch_warnings():
+        # All-null and infinite columns legitimately produce NaN stats
+        warnings.simplefilter('ignore', RuntimeWarning)
+        means = np.nanmean(arr2d, axis=0)
+        maxs = np.nanmax(arr2d, axis=0)
+        mins = np.nanmin(arr2d, axis=0)
+        m2s = np.nanvar(arr2d, axis=0) * counts
+    return counts, means, maxs, mins, m2s
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _row_has_null(arr2d):
+        """Flag rows of a 2D float array that contain at least one NaN."""
+        n_rows, n_cols = arr2d.shape
+        out = np.zeros(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                if np.isnan(arr2d[i, j]):
+                    out[i] = True
+                    break
+        return out
+    
+    # fastmath minus 'nnan'/'ninf': the kernels must still see NaN and inf
+    _FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    
+    # No fastmath: reassociation would fold the Kahan compensation away
+    @njit(cache=True)
+    def _mean_skipna(arr):
+        """Return (sum, count) of the non-NaN values of a 1D array."""
+        total = 0.0
+        compensation = 0.0
+        count = 0
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            # Select instead of branching so LLVM emits a compare-and-mask
+            isn = v != v
+            # Kahan summation: carry the low-order bits lost by each addition
+            y = (0.0 if isn else v) - compensation
+            t = total + y
+            compensation = (t - total) - y
+            # Once the sum is infinite the compensation is NaN; drop it so
+            # +/-inf propagate like a plain sum
+            compensation = compensation if compensation == compensation else 0.0
+            total = t
+            count += 0 if isn else 1
+        return total, count
+    
+    @njit(cache=True, fastmath=_FASTMATH_FLAGS)
+    def _max_skipna(arr):
+        """Return the maximum non-NaN value of a 1D array (NaN if there is none)."""
+        result = -np.inf
+        seen = False
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            if not np.isnan(v):
+                seen = True
+                if v > result:
+                    result = v
+        return result if seen else np.nan
+    
+    @njit(parallel=True, cache=True)
+    def _column_stats(arr2d):
+        """
+        Return per-column (count, mean, max, min, M2) of a 2D float array,
+        skipping NaN, in one pass over each column.
+        
+        M2 is the sum of squared deviations from the mean (Welford), so the
+        sample variance is M2 / (count - 1). Columns holding +/-inf get the
+        plain sum's mean (inf, -inf or NaN) and a NaN M2, as in pandas.
+        """
+        n_rows, n_cols = arr2d.shape
+        counts = np.zeros(n_cols, dtype=np.int64)
+        means = np.full(n_cols, np.nan)
+        maxs = np.full(n_cols, np.nan)
+        mins = np.full(n_cols, np.nan)
+        m2s = np.full(n_cols, np.nan)
+        # One thread per column: every accumulator stays private to its thread
+        for j in prange(n_cols):
+            count = 0
+            total = 0.0
+            mean = 0.0
+            m2 = 0.0
+            hi = -np.inf
+            lo = np.inf
+            for i in range(n_rows):
+                v = arr2d[i, j]
+                if not np.isnan(v):
+                    count += 1
+                    total += v
+                    delta = v - mean
+                    mean += delta / count
+                    m2 += delta * (v - mean)
+                    if v > hi:
+                        hi = v
+                    if v < lo:
+                        lo = v
+            counts[j] = count
+            if not np.isfinite(total):
+                # Welford's update is NaN for inf; keep the plain sum's result
+                mean = total / count
+                m2 = np.nan
+            if count:
+                m2s[j] = m2
+                means[j] = mean
+                maxs[j] = hi
+                mins[j] = lo
+        return counts, means, maxs, mins, m2s
+else:
+    def _row_has_null(arr2d):
+        """Flag rows of a 2D float array that contain at least one NaN."""
+        return np.isnan(arr2d).any(axis=1)
+    
+    def _mean_skipna(arr):
+        """Return (sum, count) of the non-NaN values of a 1D array."""
+        with np.errstate(invalid='ignore'):  # inf + -inf is NaN, as in the kernel
+            total = np.nansum(arr)
+        return total, np.count_nonzero(~np.isnan(arr))
+    
+    def _max_skipna(arr):
+        """Return the maximum non-NaN value of a 1D array (NaN if there is none)."""
+        if not arr.size:
+            return np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN slice
+            return np.nanmax(arr)
+    
+    _column_stats = _column_stats_numpy
+
+
+def _copy_on_write_enabled() -> bool:
+    """Return whether pandas copy-on-write is in effect (always from pandas 3)."""
+    return PANDAS_MAJOR_VERSION >= 3 or pd.get_option('mode.copy_on_write') is True
+
+
+def _int_mean(arr: np.ndarray) -> float:
+    """Return the mean of a 1D integer array from its exact integer sum."""
+    if arr.dtype.itemsize < 8 and arr.size < 2 ** 32:
+        # Values of 32 bits or less cannot overflow an int64 total this short
+        return int(arr.sum(dtype=np.int64)) / arr.size
+    bound = max(abs(int(arr.min())), abs(int(arr.max())))
+    if bound * arr.size < 2 ** 63:
+        return int(arr.sum(dtype=np.int64)) / arr.size
+    # The int64 total could wrap around: sum as Python integers instead
+    return int(np.add.reduce(arr, dtype=object)) / arr.size
+
+
+class _PandasBackend:
+    """Dataset operations for pandas DataFrames (the default backend)."""
+    
+    name = 'pandas'
+    
+    def coerce(self, data) -> pd.DataFrame:
+        """Return data as a pandas DataFrame, converting Polars input."""
+        if POLARS_AVAILABLE and isinstance(data, pl.DataFrame):
+            return data.to_pandas()
+        return data
+    
+    def to_pandas(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return data as a pandas DataFrame."""
+        return data
+    
+    def read_csv(self, file_path: str, columns: Optional[list] = None,
+                 dtypes: Optional[dict] = None, engine: Optional[str] = None,
+                 downcast: bool = False, arrow_dtypes: bool = False,
+                 categorize: bool = False) -> pd.DataFrame:
+        """Read a CSV file, optionally narrowing numeric dtypes and categorizing text."""
+        if engine is None:
+            engine = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+        backend_options = {'dtype_backend': 'pyarrow'} if arrow_dtypes else {}
+        data = None
+        if engine == 'pyarrow':
+            # Multithreaded parse; columns stay Arrow-backed only on request
+            try:
+                if PYARROW_AVAILABLE and dtypes is None:
+                    data = self._read_csv_mmap(file_path, columns, arrow_dtypes)
+                else:
+                    data = pd.read_csv(file_path, usecols=columns, dtype=dtypes,
+                                       engine='pyarrow', **backend_options)
+            except (ImportError, ValueError, KeyError):
+                engine = 'c'
+            if data is not None and columns is not None:
+                # PyArrow keeps the caller's column order; match the C engine's file order
+                header = pd.read_csv(file_path, nrows=0).columns
+                data = data[[col for col in header if col in data.columns]]
+        if data is None:
+            options = {'low_memory': False} if engine == 'c' else {}
+            data = pd.read_csv(file_path, usecols=columns, dtype=dtypes, engine=engine,
+                               cache_dates=True, **options, **backend_options)
+        if downcast:
+            data = self._downcast_columns(data)
+        if categorize:
+            data = self._categorize_text_columns(data)
+        return data
+    
+    @staticmethod
+    def _read_csv_mmap(file_path: str, columns: Optional[list] = None,
+                       arrow_dtypes: bool = False) -> pd.DataFrame:
+        """
+        Parse a memory-mapped CSV file with PyArrow.
+        
+        Columns come back with the same numpy dtypes as the C engine, or as
+        Arrow-backed columns when arrow_dtypes is set.
+        """
+        read_options = pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE)
+        convert_options = pa_csv.ConvertOptions(include_columns=columns, strings_can_be_null=True)
+        # The kernel pages the file in on demand instead of a read() into a buffer
+        with pa.memory_map(file_path, 'r') as source:
+            if not arrow_dtypes:
+                # The C engine leaves dates as text; keep them as strings too
+                schema = pa_csv.open_csv(source, read_options=read_options,
+                                         convert_options=convert_options).schema
+                convert_options.column_types = {
+                    field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)
+                }
+                source.seek(0)
+            table = pa_csv.read_csv(source, read_options=read_options,
+                                    convert_options=convert_options)
+        return table.to_pandas(types_mapper=pd.ArrowDtype if arrow_dtypes else None)
+    
+    @staticmethod
+    def _downcast_columns(data: pd.DataFrame) -> pd.DataFrame:
+        """Return data with numeric columns stored in their narrowest dtype."""
+        data = data.copy(deep=False)
+        for col in data.select_dtypes(include=['integer']).columns:
+            data[col] = pd.to_numeric(data[col], downcast='integer')
+        for col in data.select_dtypes(include=['floating']).columns:
+            data[col] = pd.to_numeric(data[col], downcast='float')
+        return data
+    
+    @staticmethod
+    def _categorize_text_columns(data: pd.DataFrame) -> pd.DataFrame:
+        """Return data with low-cardinality text columns stored as categoricals."""
+        text_columns = [
+            col for col in data.select_dtypes(include=['object', 'string']).columns
+            if data[col].nunique() < CATEGORY_MAX_UNIQUE_RATIO * len(data)
+        ]
+        if not text_columns:
+            return data
+        
+        data = data.copy(deep=False)
+        for col in text_columns:
+            data[col] = data[col].astype('category')
+        return data
+    
+    def schema(self, data: pd.DataFrame) -> dict:
+        """Return {column: (dtype, is_numeric)}."""
+        numeric_cols = set(data.select_dtypes(include=[np.number]).columns)
+        return {col: (dtype, col in numeric_cols) for col, dtype in data.dtypes.items()}
+    
+    def drop_nulls(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Return the rows of data without missing values."""
+        columns = list(data.columns)
+        keep = np.ones(len(data), dtype=bool)
+        if NUMBA_AVAILABLE:
+            # One parallel pass over the numeric block instead of per-column masks;
+            # dtypes come from the frame itself, which may have been edited in place
+            numeric = set(data.select_dtypes(include=['integer', 'floating']).columns)
+            if numeric:
+                arr = data[[col for col in columns if col in numeric]].to_numpy(
+                    dtype=np.float64, na_value=np.nan)
+                keep &= ~_row_has_null(np.ascontiguousarray(arr))
+                columns = [col for col in columns if col not in numeric]
+        
+        # Fold each remaining column into the same mask in place
+        for col in columns:
+            keep &= data[col].notna().to_numpy()
+        return data.iloc[keep]
+    
+    def filter_eq(self, data: pd.DataFrame, column: str, value) -> pd.DataFrame:
+        """Return the rows of data where column equals value."""
+        series = data[column]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+            # Plain numpy column: compare the raw buffer and take by position
+            col_arr = series.to_numpy()
+            # numexpr only handles 32/64-bit signed ints and floats, and values
+            # that fit the column's dtype (e.g. not Python ints beyond int64)
+            if (NUMEXPR_AVAILABLE and len(col_arr) >= NUMEXPR_MIN_ROWS
+                    and col_arr.dtype.kind in 'if' and col_arr.dtype.itemsize >= 4
+                    and isinstance(value, (int, float, np.number))
+                    and np.can_cast(np.min_scalar_type(value), col_arr.dtype)):
+                mask = numexpr.evaluate('col == value', local_dict={'col': col_arr, 'value': value})
+            else:
+                mask = col_arr == value
+            return data.take(np.flatnonzero(mask))
+        if PYARROW_AVAILABLE and isinstance(series.dtype, pd.ArrowDtype):
+            # Arrow-backed column: typed compare kernel on the Arrow buffers
+            try:
+                matches = pc.equal(pa.array(series.array), pa.scalar(value))
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                matches = None  # incomparable types: use pandas' semantics below
+            if matches is not None:
+                mask = pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+                return data.take(np.flatnonzero(mask))
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Categorical column: match the value's integer code, not strings
+            try:
+                code = series.cat.categories.get_loc(value)
+            except KeyError:
+                code = -2  # never matches; -1 is reserved for missing values
+            mask = series.cat.codes.to_numpy() == code
+            return data.take(np.flatnonzero(mask))
+        # Object/extension dtypes keep pandas' comparison semantics
+        return data[series == value]
+    
+    def column_array(self, data: pd.DataFrame, column: str,
+                     cache: Optional[dict] = None) -> np.ndarray:
+        """
+        Return column as a contiguous 1D numpy array with nulls as NaN.
+        
+        Extension-dtype columns (nullable or Arrow-backed) are converted with
+        a copy; cache, if given, keeps {column: (series, array)} so repeated
+        reductions of the same column reuse that copy. The held Series makes
+        copy-on-write give the frame a new backing array on any edit, so an
+        entry is valid while the frame's column still has the same array.
+        Writes made directly into a column's .array bypass this check.
+        
+        Raises:
+            TypeError: If column does not hold integers or real floats
+        """
+        series = data[column]
+        # Complex and timedelta columns count as numbers but would be
+        # silently truncated (or NaT read as int64 min) by the kernels
+        if series.dtype.kind not in 'iuf':
+            raise TypeError(f"Column '{column}' is not numeric. Type: {series.dtype}")
+        if isinstance(series.dtype, np.dtype):
+            # Plain numpy column: keep its native dtype, usually without a copy
+            return np.ascontiguousarray(series.to_numpy())
+        if cache is not None and _copy_on_write_enabled():
+            cached = cache.get(column)
+            if cached is not None and cached[0].array is series.array:
+                return cached[1]
+            arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            cache[column] = (series, arr)
+            return arr
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    def mean(self, data: pd.DataFrame, column: str,
+             cache: Optional[dict] = None) -> Optional[float]:
+        """Return the mean of column, skipping nulls (None if all are null)."""
+        arr = self.column_array(data, column, cache)
+        if arr.dtype.kind in 'iu':
+            # Integer columns hold no NaN: sum exactly in integers
+            return _int_mean(arr) if arr.size else None
+        # NaN-aware reduction on the raw buffer: skips nulls in a single pass,
+        # counting the values it kept
+        total, count = _mean_skipna(arr)
+        return float(total / count) if count else None
+    
+    def max(self, data: pd.DataFrame, column: str,
+            cache: Optional[dict] = None) -> Optional[float]:
+        """Return the maximum of column, skipping nulls (None if all are null)."""
+        arr = self.column_array(data, column, cache)
+        if arr.dtype.kind in 'iu':
+            # Integer columns hold no NaN: a plain SIMD max needs no null mask
+            return float(arr.max()) if arr.size else None
+        result = float(_max_skipna(arr))
+        return None if np.isnan(result) else result
+    
+    def summary(self, data: pd.DataFrame) -> dict:
+        """Return mean/max/min/std/count for every numeric column."""
+        numeric_data = data.select_dtypes(include=[np.number])
+        if numeric_data.columns.empty:
+            return {}
+        
+        # Materialise the numeric block once, column-major so each column's
+        # statistics come from a single contiguous pass
+        arr = np.asfortranarray(numeric_data.to_numpy(dtype=np.float64, na_value=np.nan))
+        counts, means, maxs, mins, m2s = _column_stats(arr)
+        
+        return {
+            col: {
+                'mean': float(means[j]),
+                'max': float(maxs[j]),
+                'min': float(mins[j]),
+                # Sample standard deviation is undefined below two values
+                'std': float(np.sqrt(m2s[j] / (counts[j] - 1))) if counts[j] > 1 else np.nan,
+                'count': int(counts[j])
+            }
+            for j, col in enumerate(numeric_data.columns)
+        }
+
+
+class _PolarsBackend:
+    """Dataset operations for Polars DataFrames."""
+    
+    name = 'polars'
+    
+    def coerce(self, data):
+        """Return data as a Polars DataFrame, converting pandas input."""
+        if isinstance(data, pd.DataFrame):
+            return pl.from_pandas(data)
+        return data
+    
+    def to_pandas(self, data) -> pd.DataFrame:
+        """Return data as a pandas DataFrame."""
+        return data.to_pandas()
+    
+    def read_csv(self, file_path: str, columns: Optional[list] = None,
+                 dtypes: Optional[dict] = None, engine: Optional[str] = None,
+                 downcast: bool = False, arrow_dtypes: bool = False,
+                 categorize: bool = False):
+        """
+        Read a CSV file; engine and arrow_dtypes are ignored, Polars always
+        uses its own reader and Arrow memory.
+        """
+        if dtypes is not None:
+            dtypes = {col: self._polars_dtype(col, dtype) for col, dtype in dtypes.items()}
+        data = pl.read_csv(file_path, columns=columns, schema_overrides=dtypes)
+        if downcast:
+            numeric = [col for col, dtype in data.schema.items() if dtype.is_numeric()]
+            data = data.with_columns([data.get_column(col).shrink_dtype() for col in numeric])
+        if categorize:
+            text = [
+                col for col, dtype in data.schema.items()
+                if dtype == pl.String and data.get_column(col).n_unique() < CATEGORY_MAX_UNIQUE_RATIO * data.height
+            ]
+            data = data.with_columns([pl.col(col).cast(pl.Categorical) for col in text])
+        return data
+    
+    @staticmethod
+    def _polars_dtype(column: str, dtype):
+        """
+        Map a pandas/numpy dtype spec to a Polars type; Polars types pass through.
+        
+        Raises:
+            ValueError: If dtype has no Polars equivalent
+        """
+        if is_polars_dtype(dtype):
+            return dtype
+        name = dtype if isinstance(dtype, str) else None
+        if name not in _POLARS_DTYPES:
+            try:
+                name = np.dtype(dtype).name
+            except TypeError:
+                pass
+        if name not in _POLARS_DTYPES:
+            raise ValueError(f"Unsupported dtype '{dtype}' for column '{column}' on the polars backend.")
+        return _POLARS_DTYPES[name]
+    
+    def schema(self, data) -> dict:
+        """Return {column: (dtype, is_numeric)}."""
+        return {col: (dtype, dtype.is_numeric()) for col, dtype in data.schema.items()}
+    
+    def drop_nulls(self, data):
+        """Return the rows of data without missing values."""
+        return data.drop_nulls()
+    
+    def filter_eq(self, data, column: str, value):
+        """Return the rows of data where column equals value."""
+        try:
+            return data.filter(pl.col(column) == value)
+        except (pl.exceptions.ComputeError, pl.exceptions.InvalidOperationError,
+                pl.exceptions.SchemaError):
+            # Value not comparable with the column: nothing matches, as in pandas
+            return data.clear()
+    
+    def mean(self, data, column: str, cache: Optional[dict] = None) -> Optional[float]:
+        """
+        Return the mean of column, skipping nulls (None if all are null);
+        cache is ignored, Polars reduces its Arrow buffers in place.
+        """
+        result = data.select(pl.col(column).mean()).item()
+        return float(result) if result is not None else None
+    
+    def max(self, data, column: str, cache: Optional[dict] = None) -> Optional[float]:
+        """
+        Return the maximum of column, skipping nulls (None if all are null);
+        cache is ignored, Polars reduces its Arrow buffers in place.
+        """
+        result = data.select(pl.col(column).max()).item()
+        return float(result) if result is not None else None
+    
+    def summary(self, data) -> dict:
+        """Return mean/max/min/std/count for every numeric column."""
+        numeric_cols = [col for col, dtype in data.schema.items() if dtype.is_numeric()]
+        if not numeric_cols:
+            return {}
+        
+        # One query computing every statistic; aliases only need to be unique
+        stats = ['mean', 'max', 'min', 'std', 'count']
+        exprs = [getattr(pl.col(col), stat)() for col in numeric_cols for stat in stats]
+        row = data.select([expr.alias(str(i)) for i, expr in enumerate(exprs)]).row(0)
+        values = iter(row)
+        return {
+            col: {
+                stat: int(value) if stat == 'count' else float('nan') if value is None else float(value)
+                for stat, value in zip(stats, values)
+            }
+            for col in numeric_cols
+        }
+
+
+class _CudfBackend:
+    """Dataset operations for cuDF DataFrames held in GPU memory."""
+    
+    name = 'cudf'
+    
+    def coerce(self, data):
+        """Return data as a cuDF DataFrame, converting pandas and Polars input."""
+        if POLARS_AVAILABLE and isinstance(data, pl.DataFrame):
+            data = data.to_pandas()
+        if isinstance(data, pd.DataFrame):
+            return cudf.from_pandas(data)
+        return data
+    
+    def to_pandas(self, data) -> pd.DataFrame:
+        """Return data as a pandas DataFrame."""
+        return data.to_pandas()
+    
+    def read_csv(self, file_path: str, columns: Optional[list] = None,
+                 dtypes: Optional[dict] = None, engine: Optional[str] = None,
+                 downcast: bool = False, arrow_dtypes: bool = False,
+                 categorize: bool = False):
+        """
+        Read a CSV file on the GPU; engine and arrow_dtypes are ignored,
+        cuDF uses its own reader and device memory.
+        
+        Files larger than CUDF_CSV_CHUNK_BYTES are parsed one byte range at a
+        time, so only one chunk of raw text is on the device at once; the
+        parsed dataset must still fit in device memory. Each chunk infers its
+        own dtypes unless dtypes is given, and concat promotes them.
+        """
+        file_size = os.path.getsize(file_path)
+        if file_size <= CUDF_CSV_CHUNK_BYTES:
+            data = cudf.read_csv(file_path, usecols=columns, dtype=dtypes)
+        else:
+            # cuDF reads every row that starts inside a range, so rows split
+            # across a boundary are parsed exactly once; later ranges carry no header
+            names = list(pd.read_csv(file_path, nrows=0).columns)
+            chunks = [
+                cudf.read_csv(file_path, usecols=columns, dtype=dtypes,
+                              byte_range=(0, CUDF_CSV_CHUNK_BYTES))
+            ]
+            for offset in range(CUDF_CSV_CHUNK_BYTES, file_size, CUDF_CSV_CHUNK_BYTES):
+                chunks.append(cudf.read_csv(file_path, header=None, names=names, usecols=columns,
+                                            dtype=dtypes, byte_range=(offset, CUDF_CSV_CHUNK_BYTES)))
+            # Ranges holding no complete row (e.g. just the header) have no
+            # inferred dtypes to contribute
+            data = cudf.concat([chunk for chunk in chunks if len(chunk)] or chunks[:1],
+                               ignore_index=True)
+        if downcast:
+            for col in data.select_dtypes(include=['integer']).columns:
+                data[col] = cudf.to_numeric(data[col], downcast='integer')
+            for col in data.select_dtypes(include=['floating']).columns:
+                data[col] = cudf.to_numeric(data[col], downcast='float')
+        if categorize:
+            for col in data.select_dtypes(include=['object', 'string']).columns:
+                if data[col].nunique() < CATEGORY_MAX_UNIQUE_RATIO * len(data):
+                    data[col] = data[col].astype('category')
+        return data
+    
+    def schema(self, data) -> dict:
+        """Return {column: (dtype, is_numeric)}."""
+        numeric_cols = set(data.select_dtypes(include=[np.number]).columns)
+        return {col: (dtype, col in numeric_cols) for col, dtype in data.dtypes.items()}
+    
+    def drop_nulls(self, data):
+        """Return the rows of data without missing values."""
+        return data.dropna()
+    
+    def filter_eq(self, data, column: str, value):
+        """Return the rows of data where column equals value."""
+        return data[data[column] == value]
+    
+    def mean(self, data, column: str, cache: Optional[dict] = None) -> Optional[float]:
+        """
+        Return the mean of column, skipping nulls (None if all are null), on
+        the GPU; cache is ignored, the column stays in device memory.
+        """
+        series = data[column]
+        return float(series.mean()) if series.count() else None
+    
+    def max(self, data, column: str, cache: Optional[dict] = None) -> Optional[float]:
+        """
+        Return the maximum of column, skipping nulls (None if all are null), on
+        the GPU; cache is ignored, the column stays in device memory.
+        """
+        series = data[column]
+        return float(series.max()) if series.count() else None
+    
+    def summary(self, data) -> dict:
+        """Return mean/max/min/std/count for every numeric column."""
+        numeric_data = data.select_dtypes(include=[np.number])
+        if numeric_data.columns.empty:
+            return {}
+        
+        # All reductions run on the GPU; only the small result table is copied back
+        stats = numeric_data.agg(['mean', 'max', 'min', 'std', 'count']).to_pandas()
+        return {
+            col: {
+                stat: int(value) if stat == 'count' else float(value)
+                for stat, value in stats[col].astype(np.float64).items()
+            }
+            for col in numeric_data.columns
+        }
+
+
+if POLARS_AVAILABLE:
+    # pandas/numpy dtype names accepted by load_data(dtypes=...) on polars
+    _POLARS_DTYPES = {
+        'int8': pl.Int8, 'int16': pl.Int16, 'int32': pl.Int32, 'int64': pl.Int64,
+        'uint8': pl.UInt8, 'uint16': pl.UInt16, 'uint32': pl.UInt32, 'uint64': pl.UInt64,
+        'float32': pl.Float32, 'float64': pl.Float64, 'bool': pl.Boolean,
+        'str': pl.String, 'string': pl.String, 'object': pl.String,
+        'category': pl.Categorical,
+    }
+
+
+_BACKENDS = {
+    'pandas': _PandasBackend,
+    'polars': _PolarsBackend,
+    'cudf': _CudfBackend,
+}
+
+# Whether each backend's library can be imported
+_BACKEND_AVAILABLE = {
+    'pandas': True,
+    'polars': POLARS_AVAILABLE,
+    'cudf': CUDF_AVAILABLE,
+}
+
+
 class DataProcessor:
     """
     A comprehensive data processing toolkit for cleaning, filtering,
     and analyzing structured datasets.
     """
     
-    def __init__(self):
-        """Initialize DataProcessor with empty dataset."""
-        self.data = None
+    def __init__(self, verbose: bool = False, backend: Optional[str] = None):
+        """
+        Initialize DataProcessor with empty dataset.
+        
+        With copy-on-write, row selections in clean_data/filter_by_value share
+        buffers with their source until either side is modified. pandas 3
+        always behaves this way; on pandas 2.x callers opt in themselves with
+        pd.set_option('mode.copy_on_write', True), as the option is global.
+        
+        Args:
+            verbose (bool): Print a progress message after each operation
+            backend (str, optional): DataFrame library holding the data,
+                'pandas', 'polars' or 'cudf'; defaults to the
+                DATA_PROCESSOR_BACKEND environment variable, else 'pandas'
+        
+        Raises:
+            ValueError: If backend is unknown
+            ImportError: If the backend library is not installed
+        """
+        if backend is None:
+            backend = os.environ.get('DATA_PROCESSOR_BACKEND', 'pandas')
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Available backends: {list(_BACKENDS)}")
+        if not _BACKEND_AVAILABLE[backend]:
+            raise ImportError(f"The {backend} backend requires the '{backend}' package.")
+        self.verbose = verbose
+        self._backend = _BACKENDS[backend]()
+        self._data = None
         self._column_types = {}  # Cache for performance optimization
+        self._np_cols = {}  # Column arrays reused across reductions
+        self._columns_index = None  # Column Index that _columns was read from
+        self._columns = ()
+    
+    @property
+    def backend(self) -> str:
+        """Return the name of the DataFrame backend."""
+        return self._backend.name
     
-    def load_data(self, file_path: str) -> bool:
+    @property
+    def data(self):
+        """Return the current dataset as a DataFrame of the active backend."""
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        """
+        Replace the dataset and refresh the cached column metadata.
+        
+        pandas and Polars DataFrames are both accepted and converted to the
+        active backend's type.
+        """
+        self._data = self._backend.coerce(value) if value is not None else None
+        self._refresh_schema()
+    
+    def to_pandas(self) -> Optional[pd.DataFrame]:
+        """Return the current dataset as a pandas DataFrame, whatever the backend."""
+        return self._backend.to_pandas(self.data) if self.data is not None else None
+    
+    def load_data(self, file_path: str, columns: Optional[list] = None,
+                  dtypes: Optional[dict] = None, engine: Optional[str] = None,
+                  downcast: bool = False, arrow_dtypes: bool = False,
+                  categorize: bool = False) -> bool:
         """
-        Load data from CSV file into pandas DataFrame.
+        Load data from CSV file into a DataFrame of the active backend.
         
         Args:
             file_path (str): Path to the CSV file
+            columns (list, optional): Only load these columns
+            dtypes (dict, optional): Column dtypes, skipping type inference
+            engine (str, optional): pandas CSV parser engine; defaults to
+                'pyarrow' when PyArrow is installed and 'c' otherwise
+            downcast (bool): Store numeric columns in the narrowest dtype that
+                holds their values
+            arrow_dtypes (bool): Keep columns as PyArrow-backed pandas dtypes
+                (pandas backend only); by default they use numpy dtypes
+            categorize (bool): Store text columns with few distinct values as
+                categoricals
             
         Returns:
             bool: True if successful
@@ -32,9 +790,13 @@ class DataProcessor:
             ValueError: If file is empty or invalid
         """
         try:
-            self.data = pd.read_csv(file_path)
-            self._precompute_column_types()
-            print(f"Successfully loaded data with {len(self.data)} rows and {len(self.data.columns)} columns")
+            if os.path.getsize(file_path) == 0:
+                raise pd.errors.EmptyDataError
+            self.data = self._backend.read_csv(file_path, columns=columns, dtypes=dtypes,
+                                               engine=engine, downcast=downcast,
+                                               arrow_dtypes=arrow_dtypes, categorize=categorize)
+            if self.verbose:
+                print(f"Successfully loaded data with {len(self.data)} rows and {len(self.data.columns)} columns")
             return True
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {file_path} was not found.")
@@ -43,12 +805,33 @@ class DataProcessor:
         except Exception as e:
             raise ValueError(f"Error loading file: {str(e)}")
     
-    def _precompute_column_types(self):
-        """Precompute column types for performance optimization."""
-        if self.data is not None:
-            self._column_types = {
-                col: str(self.data[col].dtype) for col in self.data.columns
-            }
+    def _refresh_schema(self):
+        """Cache each column's (dtype, is_numeric) pair and drop cached column arrays."""
+        self._column_types = self._backend.schema(self.data) if self.data is not None else {}
+        self._np_cols = {}
+    
+    def _check_numeric_column(self, column: str):
+        """
+        Validate that column can be reduced, using the cached schema.
+        
+        Columns added to the frame in place miss the cache, which is then
+        refreshed from the data.
+        
+        Raises:
+            ValueError: If no data is loaded or the column is missing
+            TypeError: For non-numeric columns
+        """
+        if self.data is None:
+            raise ValueError("No data loaded. Please load data first.")
+        
+        if column not in self._column_types:
+            if column not in self.data.columns:
+                raise ValueError(f"Column '{column}' not found in data.")
+            self._refresh_schema()
+        
+        dtype, is_numeric = self._column_types[column]
+        if not is_numeric:
+            raise TypeError(f"Column '{column}' is not numeric. Type: {dtype}")
     
     def clean_data(self) -> int:
         """
@@ -64,13 +847,13 @@ class DataProcessor:
             raise ValueError("No data loaded. Please load data first.")
         
         initial_size = len(self.data)
-        self.data = self.data.dropna()
+        self.data = self._backend.drop_nulls(self.data)
         final_size = len(self.data)
         
-        removed_count = initial_size - final_size
-        print(f"Data cleaning: {removed_count} rows removed ({removed_count/initial_size*100:.1f}%)")
+        if self.verbose:
+            removed_count = initial_size - final_size
+            print(f"Data cleaning: {removed_count} rows removed ({removed_count/initial_size*100:.1f}%)")
         
-        self._precompute_column_types()
         return final_size
     
     def filter_by_value(self, column: str, value: Union[str, int, float]) -> int:
@@ -89,14 +872,15 @@ class DataProcessor:
         """
         if self.data is None:
             raise ValueError("No data loaded. Please load data first.")
-        if column not in self.data.columns:
-            raise ValueError(f"Column '{column}' not found in data. Available columns: {list(self.data.columns)}")
+        # The cached schema is a dict, so the lookup is a hash probe
+        if column not in self._column_types:
+            raise ValueError(f"Column '{column}' not found in data. Available columns: {list(self._column_types)}")
         
-        mask = self.data[column] == value
-        self.data = self.data[mask]
+        self.data = self._backend.filter_eq(self.data, column, value)
         result_count = len(self.data)
         
-        print(f"Filtered by {column}={value}: {result_count} rows match")
+        if self.verbose:
+            print(f"Filtered by {column}={value}: {result_count} rows match")
         return result_count
     
     def calculate_mean(self, column: str) -> float:
@@ -113,24 +897,13 @@ class DataProcessor:
             ValueError: For various error conditions
             TypeError: For non-numeric columns
         """
-        if self.data is None:
-            raise ValueError("No data loaded. Please load data first.")
-        if column not in self.data.columns:
-            raise ValueError(f"Column '{column}' not found in data.")
-        
-        # Use cached type check for performance
-        if not np.issubdtype(self.data[column].dtype, np.number):
-            raise TypeError(f"Column '{column}' is not numeric. Type: {self._column_types.get(column, 'unknown')}")
-        
-        if self.data[column].isnull().all():
+        self._check_numeric_column(column)
+        # The reduction counts the values it skips nulls over, so an all-null
+        # column is detected without a separate pass
+        result = self._backend.mean(self.data, column, self._np_cols)
+        if result is None:
             raise ValueError(f"Column '{column}' contains only null values.")
-        
-        # Handle partial nulls efficiently
-        valid_data = self.data[column].dropna()
-        if len(valid_data) == 0:
-            raise ValueError(f"No valid numeric values in column '{column}'")
-        
-        return float(valid_data.mean())
+        return result
     
     def find_max(self, column: str) -> float:
         """
@@ -146,19 +919,11 @@ class DataProcessor:
             ValueError: For various error conditions
             TypeError: For non-numeric columns
         """
-        if self.data is None:
-            raise ValueError("No data loaded. Please load data first.")
-        if column not in self.data.columns:
-            raise ValueError(f"Column '{column}' not found in data.")
-        
-        if not np.issubdtype(self.data[column].dtype, np.number):
-            raise TypeError(f"Column '{column}' is not numeric. Type: {self._column_types.get(column, 'unknown')}")
-        
-        if self.data[column].isnull().all():
+        self._check_numeric_column(column)
+        result = self._backend.max(self.data, column, self._np_cols)
+        if result is None:
             raise ValueError(f"Column '{column}' contains only null values.")
-        
-        valid_data = self.data[column].dropna()
-        return float(valid_data.max())
+        return result
     
     def get_summary_stats(self) -> dict:
         """
@@ -173,26 +938,105 @@ class DataProcessor:
         if self.data is None:
             raise ValueError("No data loaded. Please load data first.")
         
-        numeric_columns = self.data.select_dtypes(include=[np.number]).columns
-        summary = {}
+        return self._backend.summary(self.data)
+    
+    def streaming_mean(self, file_path: str, column: str, chunksize: int = 100_000) -> float:
+        """
+        Calculate the mean of a numeric CSV column without loading the file.
         
-        for col in numeric_columns:
-            summary[col] = {
-                'mean': float(self.data[col].mean()),
-                'max': float(self.data[col].max()),
-                'min': float(self.data[col].min()),
-                'std': float(self.data[col].std()),
-                'count': int(self.data[col].count())
-            }
+        Only the requested column is read, chunksize rows at a time, so peak
+        memory is bounded by the chunk rather than the file. The loaded
+        dataset is not touched.
         
-        return summary
+        Args:
+            file_path (str): Path to the CSV file
+            column (str): Numeric column name
+            chunksize (int): Rows read per chunk
+            
+        Returns:
+            float: Mean value
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the file is empty, the column is missing or only null
+            TypeError: For non-numeric columns
+        """
+        total = 0.0
+        count = 0
+        try:
+            header = pd.read_csv(file_path, nrows=0).columns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {file_path} was not found.")
+        except pd.errors.EmptyDataError:
+            raise ValueError("The file is empty.")
+        if column not in header:
+            raise ValueError(f"Column '{column}' not found in data.")
+        
+        reader = pd.read_csv(file_path, usecols=[column], chunksize=chunksize)
+        
+        with reader:
+            for chunk in reader:
+                values = chunk[column]
+                if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                    raise TypeError(f"Column '{column}' is not numeric. Type: {values.dtype}")
+                arr = values.to_numpy(dtype=np.float64, na_value=np.nan)
+                total += np.nansum(arr)
+                count += np.count_nonzero(~np.isnan(arr))
+        
+        if count == 0:
+            raise ValueError(f"Column '{column}' contains only null values.")
+        return float(total / count)
+    
+    def streaming_clean(self, input_path: str, output_path: str, chunksize: int = 100_000) -> int:
+        """
+        Copy a CSV file to output_path, dropping rows with any missing values.
+        
+        Rows are processed chunksize at a time, so files larger than memory
+        can be cleaned. The loaded dataset is not touched.
+        
+        Args:
+            input_path (str): Path to the source CSV file
+            output_path (str): Path the cleaned CSV file is written to
+            chunksize (int): Rows read per chunk
+            
+        Returns:
+            int: Number of rows written
+            
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            ValueError: If input file is empty
+        """
+        rows_written = 0
+        try:
+            reader = pd.read_csv(input_path, chunksize=chunksize)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {input_path} was not found.")
+        except pd.errors.EmptyDataError:
+            raise ValueError("The file is empty.")
+        
+        with reader:
+            for i, chunk in enumerate(reader):
+                cleaned = chunk.dropna()
+                cleaned.to_csv(output_path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+                rows_written += len(cleaned)
+        
+        return rows_written
     
     @property
     def shape(self) -> tuple:
         """Return current data shape (rows, columns)."""
-        return self.data.shape if self.data is not None else (0, 0)
+        # Read from the frame itself (O(1) on every backend) so in-place
+        # edits, including appended rows, are always reflected
+        return tuple(self.data.shape) if self.data is not None else (0, 0)
     
     @property
     def columns(self) -> list:
         """Return list of column names."""
-        return list(self.data.columns) if self.data is not None else []
\ No newline at end of file
+        if self.data is None:
+            return []
+        index = self.data.columns
+        # pandas replaces its immutable column Index whenever columns change,
+        # so names are only re-read when the frame holds a different Index
+        if index is not self._columns_index:
+            self._columns_index, self._columns = index, tuple(index)
+        return list(self._columns)
\ No newline at end of file
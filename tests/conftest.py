@@ -3,12 +3,109 @@ Shared pytest fixtures for DataProcessor tests.
 """
 import pytest
 import pandas as pd
+import numpy as np
 import tempfile
 import os
+import io
+
+@pytest.fixture(autouse=True)
+def _pandas_backend_by_default(monkeypatch):
+    """Keep DATA_PROCESSOR_BACKEND from switching the backend under pandas-specific tests."""
+    monkeypatch.delenv('DATA_PROCESSOR_BACKEND', raising=False)
+
+class _FakeCudfSeries(pd.Series):
+    """pandas Series standing in for a cuDF Series."""
+
+    @property
+    def _constructor(self):
+        return _FakeCudfSeries
+
+    @property
+    def _constructor_expanddim(self):
+        return _FakeCudfDataFrame
+
+    def to_pandas(self):
+        return pd.Series(self)
+
+class _FakeCudfDataFrame(pd.DataFrame):
+    """pandas DataFrame standing in for a cuDF DataFrame."""
+
+    @property
+    def _constructor(self):
+        return _FakeCudfDataFrame
+
+    @property
+    def _constructor_sliced(self):
+        return _FakeCudfSeries
+
+    def agg(self, func=None, axis=0, *args, **kwargs):
+        # pandas builds multi-function results as plain DataFrames
+        return _FakeCudfDataFrame(super().agg(func, axis, *args, **kwargs))
+
+    def to_pandas(self):
+        return pd.DataFrame(self)
+
+def _row_start(text, pos):
+    """Return the offset of the first CSV row starting at or after pos."""
+    if pos == 0 or text[pos - 1:pos] == b'\n':
+        return pos
+    newline = text.find(b'\n', pos)
+    return len(text) if newline < 0 else newline + 1
+
+class _FakeCudf:
+    """
+    The parts of the cudf module used by the cuDF backend, on the CPU.
+
+    read_csv emulates byte_range: it parses the rows that start inside the
+    range, as cuDF does. Every read_csv call's keyword arguments are recorded.
+    """
+
+    DataFrame = _FakeCudfDataFrame
+
+    def __init__(self):
+        self.read_csv_calls = []
+
+    def read_csv(self, file_path, byte_range=None, **kwargs):
+        self.read_csv_calls.append(dict(kwargs, byte_range=byte_range))
+        with open(file_path, 'rb') as f:
+            text = f.read()
+        if byte_range is not None:
+            offset, size = byte_range
+            end = min(offset + size, len(text)) if size else len(text)
+            text = text[_row_start(text, offset):_row_start(text, end)]
+        return _FakeCudfDataFrame(pd.read_csv(io.BytesIO(text), **kwargs))
+
+    def from_pandas(self, data):
+        return _FakeCudfDataFrame(data)
+
+    def concat(self, frames, ignore_index=False):
+        return _FakeCudfDataFrame(pd.concat(frames, ignore_index=ignore_index))
+
+    def to_numeric(self, series, downcast=None):
+        return _FakeCudfSeries(pd.to_numeric(series, downcast=downcast))
 
 @pytest.fixture
-def sample_dataframe():
-    """Provides a sample DataFrame for standard tests."""
+def fake_cudf(monkeypatch):
+    """Enable the cuDF backend on top of a CPU stand-in for the cudf module."""
+    from src import data_processor
+    fake = _FakeCudf()
+    monkeypatch.setattr(data_processor, 'cudf', fake, raising=False)
+    monkeypatch.setattr(data_processor, 'CUDF_AVAILABLE', True)
+    monkeypatch.setitem(data_processor._BACKEND_AVAILABLE, 'cudf', True)
+    return fake
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_jit():
+    """Compile (or load cached) Numba kernels once, before any test is timed."""
+    from src.data_processor import _row_has_null, _mean_skipna, _max_skipna, _column_stats
+    values = np.array([1.0, np.nan])
+    _mean_skipna(values)
+    _max_skipna(values)
+    _row_has_null(values.reshape(2, 1))
+    _column_stats(np.asfortranarray(values.reshape(2, 1)))
+
+def _make_sample_dataframe():
+    """Build the sample DataFrame shared by the sample fixtures."""
     return pd.DataFrame({
         'id': [1, 2, 3, 4, 5],
         'value': [10.5, 20.3, None, 40.7, 50.1],
@@ -16,6 +113,22 @@ def sample_dataframe():
         'score': [100, 200, 150, 300, 250]
     })
 
+@pytest.fixture
+def sample_dataframe():
+    """Provides a sample DataFrame for standard tests."""
+    return _make_sample_dataframe()
+
+@pytest.fixture(scope="class")
+def processor_with_sample():
+    """
+    Provides a DataProcessor preloaded with the sample data, shared by every
+    test in a class. Only use it in tests that do not clean or filter.
+    """
+    from src.data_processor import DataProcessor
+    processor = DataProcessor()
+    processor.data = _make_sample_dataframe()
+    return processor
+
 @pytest.fixture
 def temp_csv_file(tmp_path, sample_dataframe):
     """Creates a temporary CSV file for testing load_data."""